@@ -1,3 +1,29 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
 
-# Create your tests here.
+
+class LoginTest(APITestCase):
+    def setUp(self):
+        """
+        Set up a user to log in with.
+        """
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.url = reverse('login')
+
+    def test_login(self):
+        """
+        Test that valid credentials return a token.
+        """
+        response = self.client.post(self.url, {'username': 'testuser', 'password': 'testpass'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('token', response.data)
+
+    def test_login_invalid_credentials(self):
+        """
+        Test that a wrong password is rejected.
+        """
+        response = self.client.post(self.url, {'username': 'testuser', 'password': 'wrongpass'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn('token', response.data)
@@ -17,29 +17,14 @@ class LoginView(KnoxLoginView):
     API view for user login.
     """
     permission_classes = [permissions.AllowAny]
+    serializer_class = LoginSerializer
 
     def post(self, request, format=None):
         """
         Handles user login and returns a Knox token.
         """
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.validated_data['user']
-        login(request, user)
-        return super().post(request, format=None)
-
-class LoginView(KnoxLoginView):
-    """
-    API view for user login.
-    """
-    permission_classes = [permissions.AllowAny]
-
-    def post(self, request, format=None):
-        """
-        Handles user login and returns a Knox token.
-        """
-        serializer = LoginSerializer(data=request.data)
+        serializer = self.serializer_class(data=request.data, context=self.get_context())
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data["user"]
         login(request, user)
-        return super().post(request, format=None)
\ No newline at end of file
+        return super().post(request, format=None)
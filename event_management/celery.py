@@ -0,0 +1,17 @@
+"""
+Celery application for event_management project.
+
+Runs background tasks (e.g. registration emails) outside the request/response cycle.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_management.settings')
+
+app = Celery('event_management')
+
+# Read CELERY_* options from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -0,0 +1,24 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    Falls back to DRF's JSON encoder for types orjson does not handle (e.g. Decimal, lazy strings).
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # Non-str keys: DRF reports ListField/DictField child errors keyed by int index.
+        # UTC_Z: match DRF's `Z` suffix for UTC datetimes.
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self.encoder_class().default, option=option)
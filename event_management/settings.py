@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'drf_spectacular',
     'knox',
@@ -55,6 +56,12 @@ REST_FRAMEWORK = {
         'knox.auth.TokenAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': (
+        'event_management.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'events.pagination.EventCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
 MIDDLEWARE = [
@@ -95,6 +102,20 @@ DATABASES = {
     'default': env.db()  # Uses URL from .env
 }
 
+# Keep connections open between requests instead of reconnecting every time
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=600)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+# Must be True when connecting through PgBouncer in transaction pooling mode
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = env.bool('DB_DISABLE_SERVER_SIDE_CURSORS', default=False)
+
+
+# Cache
+# Set CACHE_URL=redis://redis:6379/1 to use Redis (django-redis)
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://')
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -150,4 +171,7 @@ EMAIL_HOST = env('EMAIL_HOST')
 EMAIL_PORT = int(env('EMAIL_PORT'))
 EMAIL_USE_TLS = env('EMAIL_USE_TLS') == 'True'
 EMAIL_HOST_USER = env('EMAIL_HOST_USER')
-EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
\ No newline at end of file
+EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
+# Celery (background tasks)
+CELERY_BROKER_URL = env('CELERY_BROKER_URL', default='redis://redis:6379/0')
+CELERY_TASK_IGNORE_RESULT = True
@@ -1,9 +1,24 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
 from .models import Event, EventRegistration
+from .pagination import CachedCountPaginator
+
+
+class CachedCountAdminMixin:
+    """
+    Uses the cached-count paginator, recounting on the first page so totals there are always fresh.
+    """
+    paginator = CachedCountPaginator
+    show_full_result_count = False  # Skip the extra unfiltered COUNT(*)
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        paginator = super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        paginator.refresh = request.GET.get(PAGE_VAR, '1') == '1'
+        return paginator
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(CachedCountAdminMixin, admin.ModelAdmin):
     """
     Admin interface for managing events.
     """
@@ -13,7 +28,7 @@ class EventAdmin(admin.ModelAdmin):
 
 
 @admin.register(EventRegistration)
-class EventRegistrationAdmin(admin.ModelAdmin):
+class EventRegistrationAdmin(CachedCountAdminMixin, admin.ModelAdmin):
     """
     Admin interface for managing event registrations.
     """
@@ -0,0 +1,121 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from .models import Event
+
+EVENTS_LAST_MODIFIED_KEY = 'events:last_modified'
+REGISTRATIONS_LAST_MODIFIED_KEY = 'registrations:last_modified'
+# Same lifetime as the cached event list; bounds staleness when CACHES is per process (locmem)
+LAST_MODIFIED_TIMEOUT = 60
+
+
+def _get_last_modified(key):
+    """
+    Returns the timestamp stored under `key`.
+    On a miss the current time is stored: changes made elsewhere (another process with a
+    local cache, or a delete that MAX() cannot see) are then never hidden for longer than
+    LAST_MODIFIED_TIMEOUT. `add` keeps a concurrent `mark_*_changed()` from being overwritten.
+    """
+    value = cache.get(key)
+    if value is None:
+        value = timezone.now()
+        if not cache.add(key, value, LAST_MODIFIED_TIMEOUT):
+            value = cache.get(key) or value
+    return value
+
+
+def mark_events_changed():
+    """
+    Records that events were created, updated or deleted.
+    """
+    cache.set(EVENTS_LAST_MODIFIED_KEY, timezone.now(), LAST_MODIFIED_TIMEOUT)
+
+
+def mark_registrations_changed():
+    """
+    Records that registrations were created or deleted.
+    """
+    cache.set(REGISTRATIONS_LAST_MODIFIED_KEY, timezone.now(), LAST_MODIFIED_TIMEOUT)
+
+
+def events_last_modified(request, *args, **kwargs):
+    """
+    Last-Modified value for event lists.
+    """
+    return _get_last_modified(EVENTS_LAST_MODIFIED_KEY)
+
+
+def registrations_last_modified(request, *args, **kwargs):
+    """
+    Last-Modified value for registration lists, which also show event titles.
+    """
+    return max(_get_last_modified(REGISTRATIONS_LAST_MODIFIED_KEY), events_last_modified(request))
+
+
+def events_etag(request, *args, **kwargs):
+    """
+    ETag for event lists, precise to the microsecond unlike Last-Modified.
+    """
+    return events_last_modified(request).isoformat()
+
+
+def registrations_etag(request, *args, **kwargs):
+    """
+    ETag for registration lists; includes the user since these lists are per user.
+    """
+    return f'{request.user.id}-{registrations_last_modified(request).isoformat()}'
+
+
+def _organizes_event(request, pk):
+    """
+    Whether event `pk` exists and is organized by the current user; checked once per request.
+    """
+    if not hasattr(request, '_organizes_event'):
+        request._organizes_event = Event.objects.filter(pk=pk, organizer_id=request.user.id).exists()
+    return request._organizes_event
+
+
+def _organizer_exists(request, username):
+    """
+    Whether a user named `username` exists; checked once per request.
+    """
+    if not hasattr(request, '_organizer_exists'):
+        request._organizer_exists = User.objects.filter(username=username).exists()
+    return request._organizer_exists
+
+
+def event_registrations_last_modified(request, pk, *args, **kwargs):
+    """
+    Last-Modified value for an event's registrations.
+    None unless the user organizes the event, so 403/404 are never answered with 304.
+    """
+    if not _organizes_event(request, pk):
+        return None
+    return registrations_last_modified(request)
+
+
+def event_registrations_etag(request, pk, *args, **kwargs):
+    """
+    ETag for an event's registrations; None unless the user organizes the event.
+    """
+    if not _organizes_event(request, pk):
+        return None
+    return registrations_etag(request)
+
+
+def organizer_events_last_modified(request, username, *args, **kwargs):
+    """
+    Last-Modified value for an organizer's events; None when the organizer does not exist.
+    """
+    if not _organizer_exists(request, username):
+        return None
+    return events_last_modified(request)
+
+
+def organizer_events_etag(request, username, *args, **kwargs):
+    """
+    ETag for an organizer's events; None when the organizer does not exist.
+    """
+    if not _organizer_exists(request, username):
+        return None
+    return events_etag(request)
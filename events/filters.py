@@ -9,8 +9,9 @@ class EventFilter(django_filters.FilterSet):
     date_from = django_filters.DateFilter(field_name="date", lookup_expr="gte", help_text="Filter events starting from this date.")
     date_to = django_filters.DateFilter(field_name="date", lookup_expr="lte", help_text="Filter events ending at this date.")
     location_contains = django_filters.CharFilter(field_name="location", lookup_expr="icontains", help_text="Search events by partial location.")
+    location_similar = django_filters.CharFilter(field_name="location", lookup_expr="trigram_similar", help_text="Search events by a location similar to the given text (typo tolerant).")
     organizer = django_filters.CharFilter(field_name="organizer__username", lookup_expr="exact", help_text="Filter events by organizer username.")
 
     class Meta:
         model = Event
-        fields = ['date_from', 'date_to', 'location_contains', 'organizer']
+        fields = ['date_from', 'date_to', 'location_contains', 'location_similar', 'organizer']
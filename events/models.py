@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
 
 class Event(models.Model):
     """
@@ -14,6 +16,17 @@ class Event(models.Model):
         help_text="User who organizes the event."
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['organizer', 'date']),
+            models.Index(fields=['date']),
+            # Trigram indexes so `icontains` (UPPER(col) LIKE ...) on location and title can use an index scan
+            GinIndex(OpClass(Upper('location'), name='gin_trgm_ops'), name='event_location_trgm_idx'),
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='event_title_trgm_idx'),
+            # Trigram index for `location__trigram_similar`
+            GinIndex(fields=['location'], opclasses=['gin_trgm_ops'], name='event_location_sim_trgm_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -34,6 +47,10 @@ class EventRegistration(models.Model):
 
     class Meta:
         unique_together = ('event', 'user')  # Prevent duplicate registrations
+        indexes = [
+            models.Index(fields=['user', 'event']),
+            models.Index(fields=['event', 'registered_at']),
+        ]
         verbose_name = "Event Registration"
         verbose_name_plural = "Event Registrations"
 
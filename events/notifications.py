@@ -1,26 +1,47 @@
-from django.core.mail import send_mail
+from celery import shared_task
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
+from django.contrib.auth.models import User
+from django.template.loader import get_template
+from .models import Event
 
 
-def send_registration_email(event, user):
+def send_registration_email(event, user, connection=None):
     """
     Sends an email confirmation to the user after successful registration.
+    Pass an open `connection` to reuse one SMTP session for several emails.
     """
     subject = f"Registration Confirmation for {event.title}"
-    message = (
-        f"Dear {user.username},\n\n"
-        f"You have successfully registered for the event '{event.title}'.\n"
-        f"Details:\n"
-        f"Date: {event.date}\n"
-        f"Location: {event.location}\n\n"
-        f"Thank you for registering!\n\n"
-        f"Best regards,\n"
-        f"Event Management Team"
+    message = get_template('events/emails/registration_confirmation.txt').render(
+        {'event': event, 'user': user}
     )
-    send_mail(
+    EmailMessage(
         subject,
         message,
         settings.DEFAULT_FROM_EMAIL,
         [user.email],
-        fail_silently=False,
-    )
+        connection=connection,
+    ).send(fail_silently=False)
+
+
+@shared_task
+def send_registration_email_task(event_id, user_id):
+    """
+    Background task that sends the registration confirmation email.
+    Re-fetches only the fields used in the message.
+    """
+    event = Event.objects.only('title', 'date', 'location').get(pk=event_id)
+    user = User.objects.only('username', 'email').get(pk=user_id)
+    send_registration_email(event, user)
+
+
+@shared_task
+def send_bulk_registration_emails_task(event_id, user_ids):
+    """
+    Background task that sends registration confirmation emails to several users
+    over a single SMTP connection.
+    """
+    event = Event.objects.only('title', 'date', 'location').get(pk=event_id)
+    with get_connection() as connection:
+        for user in User.objects.filter(pk__in=user_ids).only('username', 'email'):
+            send_registration_email(event, user, connection=connection)
@@ -0,0 +1,50 @@
+import hashlib
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Cursor pagination for event lists, newest events first.
+    """
+    ordering = '-date'
+
+
+class RegistrationCursorPagination(CursorPagination):
+    """
+    Cursor pagination for registration lists, most recent registrations first.
+    """
+    ordering = '-registered_at'
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the total row count for a short time.
+    The cache key is derived from the SQL of the paginated queryset, so different filters get separate counts.
+    Set `refresh` to recount and overwrite the cached value.
+    """
+    count_cache_timeout = 60  # seconds
+    refresh = False
+
+    @cached_property
+    def count(self):
+        """
+        Returns the cached total number of objects, counting them on a cache miss or refresh.
+        """
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return len(self.object_list)
+
+        try:
+            sql = str(query)
+        except EmptyResultSet:  # e.g. `.none()` or `pk__in=[]`: no SQL to key on, and nothing to count
+            return 0
+        key = 'paginator:count:' + hashlib.md5(sql.encode()).hexdigest()
+        count = None if self.refresh else cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(key, count, self.count_cache_timeout)
+        return count
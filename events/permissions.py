@@ -10,4 +10,5 @@ class IsOrganizerOrReadOnly(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         # Only the organizer can modify or delete the object
-        return obj.organizer == request.user
+        # Compare ids so the organizer row does not need to be loaded
+        return obj.organizer_id == request.user.id
@@ -1,8 +1,101 @@
+import copy
+from collections.abc import Mapping
+from operator import attrgetter
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject, RelatedField
 from .models import Event, EventRegistration
 
+_MISSING = object()
 
-class EventSerializer(serializers.ModelSerializer):
+
+class CachedFieldsMixin:
+    """
+    Caches the result of `get_fields()` per serializer class.
+    Each instance gets copies of the cached fields instead of rebuilding them: shallow copies
+    with their own validators list for plain fields, deep copies for fields that nest other fields.
+    """
+    _fields_cache = {}
+    _composite_fields = (
+        serializers.BaseSerializer, serializers.ListField, serializers.DictField, serializers.ManyRelatedField
+    )
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+
+        fields = {}
+        for name, field in self._fields_cache[cls].items():
+            if isinstance(field, self._composite_fields):
+                # Rebuilt so the nested child is bound to this copy (and gets this serializer's context)
+                fields[name] = copy.deepcopy(field)
+            else:
+                fields[name] = copy.copy(field)
+                if '_validators' in field.__dict__:
+                    fields[name].validators = list(field.validators)
+        return fields
+
+
+class AttrGetterMixin:
+    """
+    Reads field values through precompiled `operator.attrgetter`s, memoized per (model class, source path).
+    Falls back to `Field.get_attribute()` for mappings, relational fields, callables and missing attributes.
+    """
+    _getter_cache = {}
+
+    def _get_readers(self, model):
+        """
+        Returns (field, getter) pairs for `model`, built once per serializer instance.
+        The getter is None for fields that always need `Field.get_attribute()`.
+        """
+        readers = self.__dict__.setdefault('_readers', {})
+        if model not in readers:
+            pairs = []
+            for field in self._readable_fields:
+                getter = None
+                if field.source != '*' and not isinstance(field, RelatedField):
+                    key = (model, tuple(field.source_attrs))
+                    if key not in self._getter_cache:
+                        self._getter_cache[key] = attrgetter('.'.join(field.source_attrs))
+                    getter = self._getter_cache[key]
+                pairs.append((field, getter))
+            readers[model] = pairs
+        return readers[model]
+
+    def to_representation(self, instance):
+        if isinstance(instance, Mapping):
+            return super().to_representation(instance)
+
+        ret = {}
+        for field, getter in self._get_readers(type(instance)):
+            attribute = _MISSING
+            if getter is not None:
+                try:
+                    value = getter(instance)
+                except (AttributeError, ObjectDoesNotExist):
+                    pass
+                else:
+                    if not callable(value):
+                        attribute = value
+
+            if attribute is _MISSING:
+                # Callable source or broken chain: let DRF resolve it
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+        return ret
+
+
+class EventSerializer(AttrGetterMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Event model.
     """
@@ -11,9 +104,18 @@ class EventSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = ['id', 'title', 'description', 'date', 'location', 'organizer']
+        read_only_fields = ['id', 'organizer']
 
 
-class EventRegistrationSerializer(serializers.ModelSerializer):
+class EventListSerializer(EventSerializer):
+    """
+    Slim serializer for event lists; leaves out the description.
+    """
+    class Meta(EventSerializer.Meta):
+        fields = ['id', 'title', 'date', 'location', 'organizer']
+
+
+class EventRegistrationSerializer(AttrGetterMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the EventRegistration model.
     """
@@ -23,3 +125,23 @@ class EventRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = EventRegistration
         fields = ['id', 'event', 'user', 'registered_at']
+        read_only_fields = fields  # Output-only; registrations are created in the view
+
+
+class RegisteredUserSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for registration rows fetched with `.values()`.
+    """
+    id = serializers.IntegerField(read_only=True)
+    user = serializers.CharField(source='user__username', read_only=True)
+    registered_at = serializers.DateTimeField(read_only=True)
+
+
+class BulkRegistrationSerializer(serializers.Serializer):
+    """
+    Input serializer for registering several users for an event.
+    """
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=500,
+        help_text="IDs of the users to register (at most 500)."
+    )
@@ -0,0 +1,63 @@
+import time
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .conditions import mark_events_changed, mark_registrations_changed
+from .models import Event, EventRegistration
+
+EVENT_LIST_CACHE_PREFIX = 'events:list'
+EVENT_LIST_CACHE_VERSION_KEY = 'events:list:version'
+
+
+def get_event_list_cache_version():
+    """
+    Returns the current version of the cached event lists; it is part of their cache key prefix.
+    Starts from the current time so a lost counter never falls back to an older version.
+    """
+    return cache.get_or_set(EVENT_LIST_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_event_list_cache():
+    """
+    Bumps the event list cache version so cached lists are no longer read; they expire on their own.
+    """
+    try:
+        version = cache.incr(EVENT_LIST_CACHE_VERSION_KEY)
+    except ValueError:  # Counter not set yet or evicted
+        cache.set(EVENT_LIST_CACHE_VERSION_KEY, time.time_ns(), None)
+        return
+    if hasattr(cache, 'delete_pattern'):  # django-redis: also free the stale entries right away
+        cache.delete_pattern(f'*.{EVENT_LIST_CACHE_PREFIX}:{version - 1}.*')
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def event_changed(sender, **kwargs):
+    """
+    Invalidates cached event lists whenever an event is created, updated or deleted.
+    """
+    invalidate_event_list_cache()
+    mark_events_changed()
+
+
+@receiver(post_save, sender=EventRegistration)
+@receiver(post_delete, sender=EventRegistration)
+def registration_changed(sender, **kwargs):
+    """
+    Updates the registrations Last-Modified timestamp.
+    """
+    mark_registrations_changed()
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Usernames are shown in event and registration lists; refresh them when a user is edited.
+    Saves that only touch other fields (e.g. `last_login` on login) are ignored.
+    """
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    invalidate_event_list_cache()
+    mark_events_changed()
+    mark_registrations_changed()
@@ -1,8 +1,20 @@
+from unittest import mock
+import datetime
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth.models import User
 from knox.models import AuthToken
+from event_management.renderers import ORJSONRenderer
 from .models import Event, EventRegistration
+from .notifications import send_bulk_registration_emails_task
+from .pagination import CachedCountPaginator
+from .serializers import AttrGetterMixin, CachedFieldsMixin
 
 
 class EventCRUDTest(APITestCase):
@@ -28,6 +40,64 @@ class EventCRUDTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Event.objects.count(), 1)
 
+    def test_event_list_cache_invalidated_on_create(self):
+        """
+        Test that the cached event list is refreshed after a new event is created.
+        """
+        response = self.client.get('/api/events/')
+        self.assertEqual(len(response.data['results']), 0)
+        Event.objects.create(organizer=self.user, **self.event_data)
+        response = self.client.get('/api/events/')
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_event_list_cache_invalidation_keeps_other_keys(self):
+        """
+        Test that invalidating the event list leaves unrelated cache entries alone.
+        """
+        cache.set('unrelated', 1)
+        self.client.get('/api/events/')
+        Event.objects.create(organizer=self.user, **self.event_data)
+        self.assertEqual(cache.get('unrelated'), 1)
+        response = self.client.get('/api/events/')
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_event_list_conditional_get(self):
+        """
+        Test that an unchanged event list answers 304 and a changed one answers 200.
+        """
+        event = Event.objects.create(organizer=self.user, **self.event_data)
+        response = self.client.get('/api/events/')
+        etag = response['ETag']
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        event.delete()
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_event_list_conditional_get_username_change(self):
+        """
+        Test that renaming an organizer invalidates the event list validators.
+        """
+        Event.objects.create(organizer=self.user, **self.event_data)
+        etag = self.client.get('/api/events/')['ETag']
+        self.user.username = 'renamed'
+        self.user.save()
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['organizer'], 'renamed')
+
+    def test_event_list_head_uses_list_serializer(self):
+        """
+        Test that HEAD serializes with the slim list serializer and doesn't load descriptions row by row.
+        """
+        for _ in range(3):
+            Event.objects.create(organizer=self.user, **self.event_data)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.head('/api/events/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in queries.captured_queries if '"description"' in q['sql']])
+
     def test_retrieve_event(self):
         """
         Test retrieving an event by ID.
@@ -52,6 +122,16 @@ class EventCRUDTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Event.objects.get(id=event.id).title, 'Updated Event')
 
+    def test_update_event_not_organizer(self):
+        """
+        Test that only the organizer can update an event.
+        """
+        other = User.objects.create_user(username='other', password='otherpass')
+        event = Event.objects.create(organizer=other, **self.event_data)
+        response = self.client.put(f'/api/events/{event.id}/', {**self.event_data, 'title': 'Hijacked'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Event.objects.get(id=event.id).title, self.event_data['title'])
+
     def test_delete_event(self):
         """
         Test deleting an event.
@@ -87,6 +167,16 @@ class EventRegistrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(EventRegistration.objects.count(), 1)
 
+    def test_registration_email_queued_on_commit(self):
+        """
+        Test that the confirmation email is queued once the registration is committed.
+        """
+        with mock.patch('events.views.send_registration_email_task.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(f'/api/events/{self.event.id}/register/')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        delay.assert_called_once_with(self.event.id, self.user.id)
+
     def test_register_twice(self):
         """
         Test that registering twice for the same event is not allowed.
@@ -95,6 +185,14 @@ class EventRegistrationTest(APITestCase):
         response = self.client.post(f'/api/events/{self.event.id}/register/')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_register_for_missing_event(self):
+        """
+        Test that registering for a non-existent event returns 404.
+        """
+        response = self.client.post(f'/api/events/{self.event.id + 1}/register/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(EventRegistration.objects.count(), 0)
+
     def test_organizer_cannot_register(self):
         """
         Test that the organizer cannot register for their own event.
@@ -106,6 +204,73 @@ class EventRegistrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class BulkEventRegistrationTest(APITestCase):
+    def setUp(self):
+        """
+        Set up test data for bulk event registration.
+        """
+        self.organizer = User.objects.create_user(username='organizer', password='organizerpass')
+        self.user1 = User.objects.create_user(username='user1', password='user1pass')
+        self.user2 = User.objects.create_user(username='user2', password='user2pass')
+        self.token = AuthToken.objects.create(self.organizer)[1]  # Generate Knox token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')  # Add token to headers
+        self.event = Event.objects.create(
+            title='Test Event',
+            description='Test Description',
+            date='2024-12-31T10:00:00Z',
+            location='Test Location',
+            organizer=self.organizer
+        )
+
+    def test_bulk_register(self):
+        """
+        Test that new users are registered and existing registrations are skipped.
+        """
+        EventRegistration.objects.create(event=self.event, user=self.user1)
+        user_ids = [self.user1.id, self.user2.id, self.organizer.id]
+        response = self.client.post(
+            f'/api/events/{self.event.id}/register_bulk/', {'user_ids': user_ids}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['registered'], 1)
+        self.assertEqual(EventRegistration.objects.filter(event=self.event).count(), 2)
+
+    def test_bulk_register_invalid_payload(self):
+        """
+        Test that malformed or oversized user id lists are rejected with 400.
+        """
+        url = f'/api/events/{self.event.id}/register_bulk/'
+        response = self.client.post(url, {'user_ids': ['abc']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('user_ids', response.json())
+        response = self.client.post(url, {'user_ids': list(range(1, 502))}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(EventRegistration.objects.count(), 0)
+
+    def test_bulk_registration_emails(self):
+        """
+        Test that the bulk email task sends one confirmation per user.
+        """
+        User.objects.filter(pk__in=[self.user1.id, self.user2.id]).update(email='user@example.com')
+        send_bulk_registration_emails_task(self.event.id, [self.user1.id, self.user2.id])
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].subject, f'Registration Confirmation for {self.event.title}')
+        self.assertIn("registered for the event 'Test Event'", mail.outbox[0].body)
+        self.assertIn('Date: 2024-12-31 10:00:00 +0000', mail.outbox[0].body)
+
+    def test_bulk_register_not_organizer(self):
+        """
+        Test that only the organizer can register users in bulk.
+        """
+        token = AuthToken.objects.create(self.user1)[1]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        response = self.client.post(
+            f'/api/events/{self.event.id}/register_bulk/', {'user_ids': [self.user2.id]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(EventRegistration.objects.count(), 0)
+
+
 class UserRegisteredEventsTest(APITestCase):
     def setUp(self):
         """
@@ -129,8 +294,8 @@ class UserRegisteredEventsTest(APITestCase):
         """
         response = self.client.get('/api/user/registrations/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['event'], self.event.title)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['event'], self.event.title)
 
 
 class RegisteredUsersTest(APITestCase):
@@ -159,6 +324,203 @@ class RegisteredUsersTest(APITestCase):
         """
         response = self.client.get(f'/api/events/{self.event.id}/registrations/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
-        self.assertEqual(response.data[0]['user'], self.user1.username)
-        self.assertEqual(response.data[1]['user'], self.user2.username)
+        self.assertEqual(len(response.data['results']), 2)
+        # Most recent registrations come first
+        self.assertEqual(response.data['results'][0]['user'], self.user2.username)
+        self.assertEqual(response.data['results'][1]['user'], self.user1.username)
+
+    def test_view_registered_users_not_organizer(self):
+        """
+        Test that only the organizer can view registered users.
+        """
+        token = AuthToken.objects.create(self.user1)[1]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        response = self.client.get(f'/api/events/{self.event.id}/registrations/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_view_registered_users_missing_event(self):
+        """
+        Test that requesting registrations for a non-existent event returns 404.
+        """
+        response = self.client.get(f'/api/events/{self.event.id + 1}/registrations/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_conditional_get_does_not_bypass_checks(self):
+        """
+        Test that validators from another list or a future date don't turn 403/404 into 304.
+        """
+        etag = self.client.get('/api/user/registrations/')['ETag']
+        future = 'Fri, 01 Jan 2100 00:00:00 GMT'
+        response = self.client.get(
+            f'/api/events/{self.event.id + 1}/registrations/', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(
+            f'/api/events/{self.event.id + 1}/registrations/', HTTP_IF_MODIFIED_SINCE=future
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        token = AuthToken.objects.create(self.user1)[1]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+        response = self.client.get(
+            f'/api/events/{self.event.id}/registrations/', HTTP_IF_MODIFIED_SINCE=future
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_conditional_get_for_organizer(self):
+        """
+        Test that the organizer gets 304 for an unchanged registration list.
+        """
+        response = self.client.get(f'/api/events/{self.event.id}/registrations/')
+        response = self.client.get(
+            f'/api/events/{self.event.id}/registrations/', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class EventsByOrganizerTest(APITestCase):
+    def setUp(self):
+        """
+        Set up test data for listing events by organizer.
+        """
+        self.organizer = User.objects.create_user(username='organizer', password='organizerpass')
+        self.event = Event.objects.create(
+            title='Test Event',
+            description='Test Description',
+            date='2024-12-31T10:00:00Z',
+            location='Test Location',
+            organizer=self.organizer
+        )
+
+    def test_view_events_by_organizer(self):
+        """
+        Test listing the events of an organizer.
+        """
+        response = self.client.get('/api/events/organizer/organizer/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['organizer'], self.organizer.username)
+
+    def test_view_events_unknown_organizer(self):
+        """
+        Test that an unknown organizer returns 404.
+        """
+        response = self.client.get('/api/events/organizer/nobody/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_conditional_get_unknown_organizer(self):
+        """
+        Test that a future If-Modified-Since does not turn 404 into 304 for an unknown organizer.
+        """
+        response = self.client.get(
+            '/api/events/organizer/nobody/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ORJSONRendererTest(APITestCase):
+    def test_render_non_str_keys(self):
+        """
+        Test that error payloads keyed by list index (ListField child errors) render.
+        """
+        data = {'user_ids': {0: ['A valid integer is required.']}}
+        rendered = ORJSONRenderer().render(data)
+        self.assertEqual(rendered, b'{"user_ids":{"0":["A valid integer is required."]}}')
+
+    def test_render_utc_datetime(self):
+        """
+        Test that UTC datetimes use the `Z` suffix like DRF's encoder.
+        """
+        value = datetime.datetime(2024, 12, 31, 10, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(ORJSONRenderer().render({'date': value}), b'{"date":"2024-12-31T10:00:00Z"}')
+
+
+class AttrGetterMixinTest(TestCase):
+    class PlainSerializer(serializers.ModelSerializer):
+        organizer = serializers.ReadOnlyField(source='organizer.username')
+        organizer_id = serializers.PrimaryKeyRelatedField(source='organizer', read_only=True)
+        label = serializers.ReadOnlyField(source='__str__')
+        missing = serializers.CharField(source='no_such_attribute', required=False)
+
+        class Meta:
+            model = Event
+            fields = ['id', 'title', 'date', 'organizer', 'organizer_id', 'label', 'missing']
+
+    class FastSerializer(AttrGetterMixin, PlainSerializer):
+        pass
+
+    def setUp(self):
+        """
+        Set up an event to serialize.
+        """
+        self.organizer = User.objects.create_user(username='organizer', password='organizerpass')
+        self.event = Event.objects.create(
+            title='Test Event',
+            description='Test Description',
+            date='2024-12-31T10:00:00Z',
+            location='Test Location',
+            organizer=self.organizer
+        )
+
+    def test_matches_model_serializer(self):
+        """
+        Test that the fast path gives the same output as DRF, including callable sources,
+        primary key related fields and skipped missing attributes.
+        """
+        event = Event.objects.select_related('organizer').get(pk=self.event.pk)
+        expected = self.PlainSerializer(event).data
+        self.assertEqual(self.FastSerializer(event).data, expected)
+        self.assertEqual(expected['label'], 'Test Event')
+        self.assertEqual(expected['organizer_id'], self.organizer.id)
+        self.assertNotIn('missing', expected)
+
+    def test_matches_model_serializer_many(self):
+        """
+        Test that list serialization matches DRF.
+        """
+        events = Event.objects.select_related('organizer')
+        self.assertEqual(
+            self.FastSerializer(events, many=True).data, self.PlainSerializer(events, many=True).data
+        )
+
+    def test_dict_input(self):
+        """
+        Test that mappings go through DRF's own lookup.
+        """
+        data = {'id': 1, 'title': 'Test Event', 'date': None, 'organizer': self.organizer}
+        self.assertEqual(self.FastSerializer(data).data, self.PlainSerializer(data).data)
+
+
+
+class CachedFieldsMixinTest(TestCase):
+    class TaggedSerializer(CachedFieldsMixin, serializers.Serializer):
+        title = serializers.CharField(max_length=10)
+        tags = serializers.ListField(child=serializers.CharField())
+
+    def test_nested_fields_are_not_shared(self):
+        """
+        Test that nested children are bound to each instance and see its context.
+        """
+        first = self.TaggedSerializer(context={'name': 'first'})
+        second = self.TaggedSerializer(context={'name': 'second'})
+        self.assertEqual(first.fields['tags'].child.context, {'name': 'first'})
+        self.assertEqual(second.fields['tags'].child.context, {'name': 'second'})
+        self.assertIsNot(first.fields['tags'].child, second.fields['tags'].child)
+
+    def test_validators_are_not_shared(self):
+        """
+        Test that changing one instance's validators leaves other instances alone.
+        """
+        first = self.TaggedSerializer()
+        second = self.TaggedSerializer()
+        first.fields['title'].validators.append(lambda value: None)
+        self.assertEqual(len(second.fields['title'].validators), len(first.fields['title'].validators) - 1)
+
+
+class CachedCountPaginatorTest(TestCase):
+    def test_empty_result_set(self):
+        """
+        Test that querysets that can never match count as 0 instead of raising.
+        """
+        self.assertEqual(CachedCountPaginator(Event.objects.none(), 10).count, 0)
+        self.assertEqual(CachedCountPaginator(Event.objects.filter(pk__in=[]), 10).count, 0)
@@ -1,16 +1,31 @@
 from rest_framework import generics, permissions, status
-from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.shortcuts import get_object_or_404
 from .models import Event, EventRegistration
-from .serializers import EventSerializer, EventRegistrationSerializer
+from .serializers import (
+    EventSerializer, EventListSerializer, EventRegistrationSerializer, RegisteredUserSerializer,
+    BulkRegistrationSerializer
+)
 from .permissions import IsOrganizerOrReadOnly
+from .pagination import RegistrationCursorPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from .filters import EventFilter
 from django.contrib.auth.models import User
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from .notifications import send_registration_email
+from .notifications import send_registration_email_task, send_bulk_registration_emails_task
+from .signals import EVENT_LIST_CACHE_PREFIX, get_event_list_cache_version
+from .conditions import (
+    event_registrations_etag, event_registrations_last_modified, events_etag, events_last_modified,
+    mark_registrations_changed, organizer_events_etag, organizer_events_last_modified,
+    registrations_etag, registrations_last_modified
+)
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
+from django.db import transaction
 
 
 @extend_schema_view(
@@ -28,7 +43,6 @@ class EventListCreateView(generics.ListCreateAPIView):
     View for listing all events and creating a new event.
     Supports advanced filtering and searching.
     """
-    queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
@@ -37,6 +51,32 @@ class EventListCreateView(generics.ListCreateAPIView):
     filterset_class = EventFilter  # Custom filter class
     search_fields = ['title']  # Searching by title
 
+    def get_queryset(self):
+        """
+        Fetches only the columns used by the list serializer.
+        """
+        return Event.objects.select_related('organizer').only(
+            'id', 'title', 'date', 'location', 'organizer__username'
+        )
+
+    def get_serializer_class(self):
+        """
+        Uses the slim serializer (no description) for listing.
+        """
+        if self.request.method in permissions.SAFE_METHODS:
+            return EventListSerializer
+        return EventSerializer
+
+    @method_decorator(condition(etag_func=events_etag, last_modified_func=events_last_modified))
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the event list, cached per query string and Authorization header.
+        The key prefix carries the cache version, which event and username changes bump.
+        """
+        key_prefix = f'{EVENT_LIST_CACHE_PREFIX}:{get_event_list_cache_version()}'
+        view = cache_page(60, key_prefix=key_prefix)(vary_on_headers('Authorization')(super().get))
+        return view(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """
         Automatically assign the currently logged-in user as the organizer.
@@ -62,26 +102,16 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     View for retrieving, updating, and deleting a specific event.
     """
-    queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [IsOrganizerOrReadOnly]
 
-    def perform_update(self, serializer):
-        """
-        Restricts updates to the organizer of the event.
-        """
-        event = self.get_object()
-        if event.organizer != self.request.user:
-            raise PermissionDenied("You are not allowed to update this event.")
-        serializer.save()
-
-    def perform_destroy(self, instance):
+    def get_queryset(self):
         """
-        Restricts deletion to the organizer of the event.
+        Joins the organizer only when the response includes it; deletes just need `organizer_id`.
         """
-        if instance.organizer != self.request.user:
-            raise PermissionDenied("You are not allowed to delete this event.")
-        instance.delete()
+        if self.request.method == 'DELETE':
+            return Event.objects.only('id', 'organizer_id')
+        return Event.objects.select_related('organizer')
 
 
 @extend_schema(
@@ -94,7 +124,7 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
     responses={
         201: {"message": "Registration successful."},
         400: {"error": "You are already registered for this event."},
-        404: {"error": "Event not found."},
+        404: {"detail": "No Event matches the given query."},
     }
 )
 class EventRegistrationView(APIView):
@@ -107,33 +137,95 @@ class EventRegistrationView(APIView):
         """
         Allows a user to register for a specific event.
         """
-        try:
-            event = Event.objects.get(pk=pk)
-        except Event.DoesNotExist:
-            return Response({"error": "Event not found"}, status=status.HTTP_404_NOT_FOUND)
+        # Only the columns needed for the checks
+        event = get_object_or_404(Event.objects.only('id', 'organizer_id'), pk=pk)
 
         # Prevent organizer from registering for their own event
-        if event.organizer == request.user:
+        if event.organizer_id == request.user.id:
             return Response(
                 {"error": "You cannot register for your own event."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Check if the user is already registered
-        if EventRegistration.objects.filter(event=event, user=request.user).exists():
+        # Create the registration unless it already exists (unique_together keeps this atomic)
+        _, created = EventRegistration.objects.get_or_create(event=event, user=request.user)
+        if not created:
             return Response(
                 {"error": "You are already registered for this event."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Create a new registration
-        EventRegistration.objects.create(event=event, user=request.user)
-        # Send email confirmation
-        send_registration_email(event, request.user)
+        # Send email confirmation in the background once the registration is committed
+        transaction.on_commit(
+            lambda: send_registration_email_task.delay(event.id, request.user.id)
+        )
 
         return Response({"message": "Registration successful."}, status=status.HTTP_201_CREATED)
 
 
+@extend_schema(
+    summary="Register several users for an event",
+    description=(
+        "Allows the organizer of an event to register a list of users in one request. "
+        "Users that are already registered, unknown user ids and the organizer are skipped."
+    ),
+    request=BulkRegistrationSerializer,
+    responses={
+        201: {"registered": 2},
+        403: {"error": "Only the organizer can register users for this event."},
+        404: {"detail": "No Event matches the given query."},
+    }
+)
+class EventBulkRegistrationView(APIView):
+    """
+    API view for registering several users for an event at once.
+    Accessible only to the event organizer.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        """
+        Registers the given users for the event with a single bulk insert.
+        """
+        event = get_object_or_404(Event.objects.only('id', 'organizer_id'), pk=pk)
+
+        if event.organizer_id != request.user.id:
+            return Response(
+                {"error": "Only the organizer can register users for this event."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = BulkRegistrationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            # Lock the event row so concurrent bulk calls for it don't count or email the same users.
+            # Self-registrations don't take this lock, so one racing with a bulk call can still be
+            # counted (and emailed) twice.
+            event = Event.objects.select_for_update().only('id', 'organizer_id').get(pk=event.pk)
+
+            # Existing users that are not registered yet (the organizer cannot register)
+            user_ids = list(
+                User.objects.filter(pk__in=serializer.validated_data['user_ids'])
+                .exclude(pk=event.organizer_id)
+                .exclude(registrations__event=event)
+                .values_list('id', flat=True)
+            )
+            EventRegistration.objects.bulk_create(
+                [EventRegistration(event=event, user_id=user_id) for user_id in user_ids],
+                ignore_conflicts=True,
+                batch_size=500,
+            )
+            # Send all confirmation emails from one background task
+            if user_ids:
+                mark_registrations_changed()  # bulk_create does not send post_save
+                transaction.on_commit(
+                    lambda: send_bulk_registration_emails_task.delay(event.id, user_ids)
+                )
+
+        return Response({"registered": len(user_ids)}, status=status.HTTP_201_CREATED)
+
+
 @extend_schema(
     summary="List registered users for an event",
     description=(
@@ -142,38 +234,52 @@ class EventRegistrationView(APIView):
         "Returns an error if the event does not exist or the user is not the organizer."
     ),
     responses={
-        200: EventRegistrationSerializer(many=True),
+        200: RegisteredUserSerializer(many=True),
         403: {"error": "You are not authorized to view registrations for this event."},
         404: {"error": "Event not found."},
     }
 )
-class RegisteredUsersView(APIView):
+class RegisteredUsersView(generics.ListAPIView):
     """
     API view for retrieving all users registered for a specific event.
     Accessible only to the event organizer.
     """
+    serializer_class = RegisteredUserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = RegistrationCursorPagination
 
-    def get(self, request, pk):
+    @method_decorator(condition(
+        etag_func=event_registrations_etag, last_modified_func=event_registrations_last_modified
+    ))
+    def list(self, request, pk):
         """
         Returns the list of registered users for the event.
+        The organizer check is folded into the registrations query; the event itself
+        is only looked up when the page comes back empty, to tell 404/403 from "no registrations".
         """
-        try:
-            event = Event.objects.get(pk=pk)
-        except Event.DoesNotExist:
-            return Response({"error": "Event not found"}, status=status.HTTP_404_NOT_FOUND)
+        page = self.paginate_queryset(self.get_queryset())
+        if not page:
+            event = Event.objects.filter(pk=pk).only('organizer_id').first()
+            if event is None:
+                return Response({"error": "Event not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        # Check if the current user is the organizer
-        if event.organizer != request.user:
-            return Response(
-                {"error": "You are not authorized to view registrations for this event."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+            # Check if the current user is the organizer
+            if event.organizer_id != request.user.id:
+                return Response(
+                    {"error": "You are not authorized to view registrations for this event."},
+                    status=status.HTTP_403_FORBIDDEN
+                )
 
-        # Get all registrations for the event
-        registrations = EventRegistration.objects.filter(event=event)
-        serializer = EventRegistrationSerializer(registrations, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_queryset(self):
+        """
+        Returns all registrations for the event, provided the current user organizes it.
+        """
+        return EventRegistration.objects.filter(
+            event_id=self.kwargs['pk'], event__organizer_id=self.request.user.id
+        ).values('id', 'registered_at', 'user__username')
 
 
 @extend_schema(
@@ -184,19 +290,26 @@ class RegisteredUsersView(APIView):
     ),
     responses={200: EventRegistrationSerializer(many=True)},
 )
-class UserRegisteredEventsView(APIView):
+class UserRegisteredEventsView(generics.ListAPIView):
     """
     API view for retrieving all events a user is registered for.
     """
+    serializer_class = EventRegistrationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = RegistrationCursorPagination
 
-    def get(self, request):
+    @method_decorator(condition(etag_func=registrations_etag, last_modified_func=registrations_last_modified))
+    def get(self, request, *args, **kwargs):
         """
-        Returns the list of events the user is registered for.
+        Returns the list of events the user is registered for; answers 304 when unchanged.
         """
-        registrations = EventRegistration.objects.filter(user=request.user)
-        serializer = EventRegistrationSerializer(registrations, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        """
+        Returns the registrations of the current user.
+        """
+        return EventRegistration.objects.filter(user=self.request.user).select_related('event', 'user')
 
 
 @extend_schema(
@@ -218,23 +331,30 @@ class UserRegisteredEventsView(APIView):
         404: {"error": "Organizer not found."},
     }
 )
-class EventsByOrganizerView(APIView):
+class EventsByOrganizerView(generics.ListAPIView):
     """
     API view to retrieve all events created by a specific organizer.
     """
+    serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
-    def get(self, request, username):
+    @method_decorator(condition(
+        etag_func=organizer_events_etag, last_modified_func=organizer_events_last_modified
+    ))
+    def list(self, request, username):
         """
         Returns a list of events organized by the specified user.
+        The organizer is only looked up when the page comes back empty, to tell 404 from "no events".
         """
-        # Searching for organizer by username
-        try:
-            organizer = User.objects.get(username=username)
-        except User.DoesNotExist:
+        page = self.paginate_queryset(self.get_queryset())
+        if not page and not User.objects.filter(username=username).exists():
             return Response({"error": "Organizer not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # Fetching events registered to organizer
-        events = Event.objects.filter(organizer=organizer)
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_queryset(self):
+        """
+        Returns the events registered to the organizer.
+        """
+        return Event.objects.filter(organizer__username=self.kwargs['username']).select_related('organizer')